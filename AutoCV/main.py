@@ -25,10 +25,6 @@ logger.add(sys.stderr, level="INFO")
 # Añadir el directorio src al path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core.profile_manager import ProfileManager
-from src.core.cv_generator import CVGenerator
-from src.scraper.linkedin_scraper import LinkedInScraper
-from src.ai.ollama_client import OllamaClient
 from src.utils.config_loader import load_config
 
 console = Console()
@@ -67,6 +63,8 @@ def cli(ctx, debug):
 @cli.command()
 def status():
     """Muestra el estado del sistema y verifica las dependencias."""
+    from src.ai.ollama_client import OllamaClient
+    
     show_banner()
     
     table = Table(title="Estado del Sistema")
@@ -108,6 +106,8 @@ def status():
 @click.option('--limit', '-n', default=20, help='Número máximo de ofertas')
 def search(query, location, limit):
     """Busca ofertas de trabajo en LinkedIn."""
+    from src.scraper.linkedin_scraper import LinkedInScraper
+    
     show_banner()
     
     console.print(f"\n🔍 Buscando: [bold]{query}[/bold]", style="cyan")
@@ -153,6 +153,9 @@ def search(query, location, limit):
 @click.option('--preview', is_flag=True, help='Ver preview antes de guardar')
 def generate(job_id, format, preview):
     """Genera un CV personalizado para una oferta específica."""
+    from src.core.profile_manager import ProfileManager
+    from src.core.cv_generator import CVGenerator
+    
     show_banner()
     
     console.print(f"\n📝 Generando CV para oferta: [bold]{job_id}[/bold]", style="cyan")
@@ -223,6 +226,8 @@ def batch(auto, confirm):
 @cli.command()
 def profile():
     """Muestra y valida tu perfil actual."""
+    from src.core.profile_manager import ProfileManager
+    
     show_banner()
     
     try:
@@ -9,6 +9,8 @@ from loguru import logger
 from pathlib import Path
 import yaml
 
+from ..utils.fast_io import SafeLoader
+
 
 class OllamaClient:
     """Cliente para interactuar con Ollama API."""
@@ -46,7 +48,7 @@ class OllamaClient:
         for config_path in possible_paths:
             if config_path.exists():
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                    return yaml.load(f, Loader=SafeLoader) or {}
         return {}
     
     def is_available(self) -> bool:
@@ -2,7 +2,6 @@
 Generador de CVs - Crea PDFs y HTML a partir del CV personalizado.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -10,6 +9,8 @@ from loguru import logger
 from jinja2 import Environment, FileSystemLoader
 import hashlib
 
+from ..utils.fast_io import json_loads
+
 # Directorio raíz del proyecto
 ROOT_DIR = Path(__file__).parent.parent.parent
 
@@ -119,10 +120,9 @@ class CVGenerator:
         # Buscar por ID
         for job_file in jobs_dir.glob("*.json"):
             try:
-                with open(job_file, 'r', encoding='utf-8') as f:
-                    job = json.load(f)
-                    if job.get('id', '').startswith(job_id) or job_id in str(job_file):
-                        return job
+                job = json_loads(job_file.read_bytes())
+                if job.get('id', '').startswith(job_id) or job_id in str(job_file):
+                    return job
             except:
                 continue
         
@@ -9,6 +9,8 @@ from pydantic import BaseModel, EmailStr, HttpUrl, validator
 from loguru import logger
 from datetime import datetime
 
+from ..utils.fast_io import SafeLoader
+
 
 class PersonalInformation(BaseModel):
     """Información personal del candidato."""
@@ -80,7 +82,7 @@ class ProfileManager:
             raise FileNotFoundError(f"Perfil no encontrado: {self.profile_path}")
         
         with open(self.profile_path, 'r', encoding='utf-8') as f:
-            self._profile = yaml.safe_load(f)
+            self._profile = yaml.load(f, Loader=SafeLoader)
         
         logger.info(f"Perfil cargado: {self.profile_path}")
         return self._profile
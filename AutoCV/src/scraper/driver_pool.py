@@ -0,0 +1,107 @@
+"""
+Driver pool - Reutiliza instancias de Chrome entre scrapers del mismo proceso.
+"""
+
+import atexit
+import threading
+from queue import Queue, Empty
+from typing import Any, Callable, Dict, Hashable
+from loguru import logger
+
+# Usos máximos de un mismo driver antes de descartarlo y lanzar uno nuevo
+MAX_USES_PER_INSTANCE = 50
+
+
+class DriverPool:
+    """Pool de WebDrivers ociosos agrupados por configuración (p. ej. headless)."""
+    
+    def __init__(self, max_idle: int = 4):
+        """
+        Inicializa el pool.
+        
+        Args:
+            max_idle: Máximo de drivers ociosos que se conservan por configuración
+        """
+        self.max_idle = max_idle
+        self._idle: Dict[Hashable, Queue] = {}
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+    
+    def _queue(self, key: Hashable) -> Queue:
+        with self._lock:
+            return self._idle.setdefault(key, Queue())
+    
+    def acquire(self, key: Hashable, factory: Callable[[], Any], timeout: float = 0) -> Any:
+        """
+        Obtiene un driver ocioso para `key` o crea uno nuevo con `factory`.
+        
+        Args:
+            key: Configuración del driver (los drivers solo se comparten entre iguales)
+            factory: Función que lanza un driver nuevo
+            timeout: Segundos a esperar por un driver ocioso antes de lanzar otro
+        
+        Returns:
+            Driver listo para usar
+        """
+        queue = self._queue(key)
+        try:
+            driver = queue.get(timeout=timeout) if timeout else queue.get_nowait()
+            logger.debug("Reutilizando driver de Chrome del pool")
+        except Empty:
+            driver = factory()
+        
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return driver
+    
+    def release(self, key: Hashable, driver: Any, reset: bool = True) -> None:
+        """
+        Devuelve un driver al pool (o lo cierra si está agotado o roto).
+        
+        Args:
+            key: Configuración con la que se obtuvo el driver
+            driver: Driver a devolver
+            reset: Si borrar cookies y navegar a about:blank antes de reutilizarlo
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0)
+        queue = self._queue(key)
+        
+        if uses >= MAX_USES_PER_INSTANCE or queue.qsize() >= self.max_idle:
+            self._quit(driver)
+            return
+        
+        if reset:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception as e:
+                logger.debug(f"Driver descartado al reiniciarlo: {e}")
+                self._quit(driver)
+                return
+        
+        queue.put(driver)
+    
+    def _quit(self, driver: Any) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close_all(self) -> None:
+        """Cierra todos los drivers ociosos."""
+        with self._lock:
+            queues = list(self._idle.values())
+        for queue in queues:
+            while True:
+                try:
+                    self._quit(queue.get_nowait())
+                except Empty:
+                    break
+
+
+# Pool compartido por todos los scrapers del proceso
+driver_pool = DriverPool()
+atexit.register(driver_pool.close_all)
@@ -2,17 +2,26 @@
 LinkedIn Scraper - Extrae ofertas de trabajo de LinkedIn.
 """
 
-import json
+import re
+import html as html_lib
 import time
 import random
+import multiprocessing as mp
+from collections import Counter
+from queue import Queue
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 import hashlib
 import yaml
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
+import httpx
+
+from .rate_limiter import TokenBucket
+from .driver_pool import driver_pool
+from ..utils.job_loader import invalidate_snapshot
+from ..utils.fast_io import SafeLoader, json_loads, json_dumps
 
 try:
     from selenium import webdriver
@@ -33,6 +42,16 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     logger.warning("Selenium no instalado. El scraper no funcionará.")
 
+# Bloques <script type="application/ld+json"> embebidos en la página de una oferta
+JSONLD_SCRIPT_RE = re.compile(
+    r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Clasificación de los "insights" de la cabecera de una oferta
+SALARY_RE = re.compile(r'[€$]')
+JOB_TYPE_RE = re.compile(r'\b(?:full-time|part-time|contract)\b', re.IGNORECASE)
+
 
 class LinkedInScraper:
     """Scraper para extraer ofertas de trabajo de LinkedIn."""
@@ -40,6 +59,67 @@ class LinkedInScraper:
     # Directorio raíz del proyecto (2 niveles arriba de este archivo)
     ROOT_DIR = Path(__file__).parent.parent.parent
     
+    # Palabras clave que identifican el bloque de descripción de una oferta
+    DESCRIPTION_KEYWORDS = [
+        "responsabilidades", "requisitos", "experiencia", "buscamos", "ofrecemos",
+        "requirements", "responsibilities", "qualifications", "skills",
+        "about the role", "experience", "developer"
+    ]
+    
+    # Devuelve el texto más largo (< 5000 chars) de las secciones candidatas
+    # que contenga alguna palabra clave, en una sola llamada al navegador
+    LONGEST_DESCRIPTION_JS = """
+        const keywords = arguments[0];
+        let best = '';
+        for (const el of document.querySelectorAll('section, div[class*="description"]')) {
+            const text = (el.innerText || '').trim();
+            if (text.length <= best.length || text.length >= 5000) continue;
+            const lower = text.toLowerCase();
+            if (keywords.some(kw => lower.includes(kw))) best = text;
+        }
+        return best;
+    """
+    
+    # Selectores CSS de la página de detalle de una oferta
+    DETAIL_SELECTORS = {
+        "title": ".job-details-jobs-unified-top-card__job-title, .top-card-layout__title",
+        "company": ".job-details-jobs-unified-top-card__company-name, .topcard__org-name-link",
+        "location": ".job-details-jobs-unified-top-card__bullet, .topcard__flavor--bullet",
+        "description": ".jobs-description__content, .description__text",
+    }
+    DETAIL_INSIGHT_SELECTOR = ".job-details-jobs-unified-top-card__job-insight"
+    DETAIL_READY_SELECTOR = ".jobs-description, .description"
+    
+    # Listado de resultados (público o con sesión) presente en la página de búsqueda
+    RESULTS_READY_SELECTOR = ".jobs-search__results-list, .scaffold-layout__list, .base-card, .job-card-container"
+    RESULT_CARD_SELECTOR = ".base-card, .job-search-card, .job-card-container"
+    NEXT_PAGE_SELECTOR = "button[aria-label='Next'], .artdeco-pagination__button--next"
+    
+    # Descripción de la página pública de una oferta (o su contenedor)
+    DESCRIPTION_READY_SELECTOR = (
+        ".show-more-less-html__markup, .description__text, "
+        ".decorated-job-posting__details, .jobs-description__content"
+    )
+    
+    # Extrae todos los campos de la página de detalle de una oferta de una vez
+    JOB_DETAILS_JS = """
+        const [selectors, insightSelector] = arguments;
+        const result = {};
+        for (const [field, sel] of Object.entries(selectors)) {
+            const el = document.querySelector(sel);
+            result[field] = el ? el.innerText.trim() : null;
+        }
+        result.insights = Array.from(
+            document.querySelectorAll(insightSelector)
+        ).map(e => e.innerText.trim());
+        return result;
+    """
+    
+    # Tarjetas analizadas antes de fijar el selector ganador de cada campo
+    SELECTOR_LEARNING_CARDS = 3
+    # Fallos tolerados del selector aprendido antes de volver a aprender
+    SELECTOR_MAX_MISSES = 3
+    
     def __init__(self, headless: bool = True, use_existing_browser: bool = False):
         """
         Inicializa el scraper.
@@ -51,6 +131,7 @@ class LinkedInScraper:
         self.headless = headless
         self.use_existing_browser = use_existing_browser
         self.driver: Optional[webdriver.Chrome] = None
+        self._pooled_driver = False
         self.is_logged_in = False
         self.jobs_dir = self.ROOT_DIR / "data" / "ofertas"
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
@@ -65,13 +146,20 @@ class LinkedInScraper:
         # Configuración de velocidad
         self.fast_mode = self.config.get('linkedin', {}).get('fast_mode', True)
         self.max_workers = self.config.get('linkedin', {}).get('max_workers', 5)
+        
+        # Límite de peticiones salientes (navegación y HTTP) compartido por todos los hilos
+        rpm = self.config.get('linkedin', {}).get('requests_per_minute', 120)
+        self._bucket = TokenBucket(rate=rpm / 60.0, capacity=10)
+        
+        # Selectores de tarjeta aprendidos durante la búsqueda actual
+        self._reset_learned_selectors()
     
     def _load_config(self) -> Dict[str, Any]:
         """Carga la configuración."""
         config_path = self.ROOT_DIR / "config" / "settings.yaml"
         if config_path.exists():
             with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         return {}
     
     def _load_linkedin_config(self) -> Dict[str, Any]:
@@ -79,18 +167,17 @@ class LinkedInScraper:
         config_path = self.ROOT_DIR / "config" / "linkedin_config.yaml"
         if config_path.exists():
             with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         return {}
     
     def _init_driver(self) -> None:
-        """Inicializa el driver de Selenium."""
+        """Inicializa el driver de Selenium (reutilizando uno del pool si lo hay)."""
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium no está instalado")
         
-        options = Options()
-        
         # Si queremos conectar a un navegador existente (debe estar abierto con --remote-debugging-port=9222)
         if self.use_existing_browser:
+            options = Options()
             options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
             try:
                 self.driver = webdriver.Chrome(options=options)
@@ -102,7 +189,18 @@ class LinkedInScraper:
                 logger.warning(f"No se pudo conectar a Chrome existente: {e}")
                 logger.info("Abriendo ventana nueva en su lugar...")
                 # Continuar con ventana nueva como fallback
-                options = Options()
+        
+        self.driver = driver_pool.acquire(self._pool_key, self._create_driver)
+        self._pooled_driver = True
+    
+    @property
+    def _pool_key(self) -> Tuple:
+        """Configuración con la que se comparten drivers en el pool."""
+        return (self.headless,)
+    
+    def _create_driver(self) -> 'webdriver.Chrome':
+        """Lanza un Chrome nuevo con las opciones anti-detección."""
+        options = Options()
         
         if self.headless:
             options.add_argument("--headless=new")
@@ -114,19 +212,30 @@ class LinkedInScraper:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
+        # Solo leemos texto: no descargar imágenes ni hojas de estilo
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        
         # Preferencias
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.stylesheet": 2,
+            "permissions.default.stylesheet": 2,
+        })
         
         service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        driver = webdriver.Chrome(service=service, options=options)
         
         # Ejecutar script para ocultar webdriver
-        self.driver.execute_script(
+        driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
         
         logger.info("Driver de Chrome inicializado")
+        return driver
     
     def _random_delay(self, min_delay: float = None, max_delay: float = None) -> None:
         """Espera un tiempo aleatorio para parecer humano."""
@@ -162,8 +271,8 @@ class LinkedInScraper:
         
         try:
             logger.info("Iniciando sesión en LinkedIn...")
+            self._bucket.acquire()
             self.driver.get("https://www.linkedin.com/login")
-            self._random_delay()
             
             # Rellenar formulario
             email_field = WebDriverWait(self.driver, 10).until(
@@ -176,6 +285,7 @@ class LinkedInScraper:
             
             # Click en login
             login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            self._bucket.acquire()
             login_button.click()
             
             self._random_delay()
@@ -233,6 +343,7 @@ class LinkedInScraper:
             self._init_driver()
         
         jobs = []
+        self._reset_learned_selectors()
         
         if use_fast_mode:
             logger.info("🚀 Modo rápido activado - búsqueda optimizada")
@@ -242,15 +353,20 @@ class LinkedInScraper:
             search_url = self._build_search_url(keywords, location, filters)
             logger.info(f"Buscando: {search_url}")
             
+            self._bucket.acquire()
             self.driver.get(search_url)
-            self._random_delay(0.5, 1) if use_fast_mode else self._random_delay()
+            
+            # Esperar al listado antes de hacer scroll (sin él no hay lazy loading que disparar)
+            try:
+                WebDriverWait(self.driver, 5 if use_fast_mode else 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.RESULTS_READY_SELECTOR))
+                )
+            except TimeoutException:
+                logger.debug("El listado de resultados no apareció a tiempo")
             
             # Si no está logueado, intentar buscar de forma anónima
             # LinkedIn público usa selectores diferentes
             
-            # Esperar a que la página cargue completamente
-            time.sleep(1.5 if use_fast_mode else 3)
-            
             # Scroll para cargar más ofertas (lazy loading)
             scroll_times = 2 if use_fast_mode else 3
             for _ in range(scroll_times):
@@ -321,14 +437,13 @@ class LinkedInScraper:
                     if not self._go_to_next_page():
                         break
                     page += 1
-                    self._random_delay()
             
             logger.info(f"Se encontraron {len(jobs)} ofertas")
             
             # Obtener descripciones
             if fetch_descriptions:
                 if use_fast_mode:
-                    # Modo rápido: obtener descripciones en paralelo con requests
+                    # Modo rápido: obtener descripciones en paralelo vía HTTP
                     logger.info("📥 Obteniendo descripciones en paralelo...")
                     jobs = self._fetch_descriptions_parallel(jobs)
                 else:
@@ -337,15 +452,13 @@ class LinkedInScraper:
                         if job.get('url'):
                             description = self._get_job_description(job['url'])
                             job['description'] = description
-                            self._random_delay(0.5, 1.5)
             else:
                 logger.info("⚡ Omitiendo descripciones para búsqueda ultra-rápida")
                 for job in jobs:
                     job['description'] = "Descripción no cargada - use vista detallada"
             
             # Guardar ofertas
-            for job in jobs:
-                self._save_job(job)
+            self._save_jobs_bulk(jobs)
             
             return jobs
             
@@ -353,10 +466,56 @@ class LinkedInScraper:
             logger.error(f"Error buscando ofertas: {e}")
             return jobs
     
+    def search_many(
+        self,
+        searches: List[Tuple[str, Optional[str]]],
+        limit: int = 20,
+        fetch_descriptions: bool = True,
+        fast_mode: bool = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Ejecuta varias búsquedas en paralelo, una por proceso.
+        
+        Cada proceso crea su propio LinkedInScraper con su propio driver;
+        los drivers nunca se comparten entre procesos.
+        
+        Args:
+            searches: Lista de tuplas (keywords, location)
+            limit: Número máximo de ofertas por búsqueda
+            fetch_descriptions: Si obtener las descripciones
+            fast_mode: Modo rápido (por defecto el configurado)
+        
+        Returns:
+            Lista con las ofertas de todas las búsquedas, en el orden de `searches`
+        """
+        if not searches:
+            return []
+        
+        use_fast_mode = fast_mode if fast_mode is not None else self.fast_mode
+        processes = max(1, min(self.max_workers, len(searches)))
+        # Cada proceso tiene su propio bucket: se reparte el límite global entre ellos
+        rate = self._bucket.rate / processes
+        capacity = max(1, self._bucket.capacity // processes)
+        tasks = [
+            (keywords, location, limit, self.headless, fetch_descriptions, use_fast_mode, rate, capacity)
+            for keywords, location in searches
+        ]
+        logger.info(f"🔀 Lanzando {len(tasks)} búsquedas en {processes} procesos")
+        
+        # 'spawn' funciona igual en Windows, macOS y Linux y no hereda el driver
+        with mp.get_context("spawn").Pool(processes) as pool:
+            results = pool.map(_search_worker, tasks)
+        
+        return [job for jobs in results for job in jobs]
+    
     def _fetch_descriptions_parallel(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Obtiene las descripciones de múltiples ofertas en paralelo.
         
+        Los hilos solo hacen peticiones HTTP: `self.driver` no es thread-safe y
+        nunca se usa desde ellos. Las ofertas cuya descripción no se pudo
+        extraer del HTML se completan después con Selenium, en el hilo principal.
+        
         Args:
             jobs: Lista de ofertas con URLs
             
@@ -368,48 +527,50 @@ class LinkedInScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'es-ES,es;q=0.9,en;q=0.8',
         }
+        failed_jobs: Queue = Queue()
         
         def fetch_description(job: Dict[str, Any]) -> Dict[str, Any]:
-            """Obtiene la descripción de una oferta usando requests."""
+            """Obtiene la descripción de una oferta usando el cliente HTTP compartido."""
             url = job.get('url', '')
             if not url:
                 job['description'] = "URL no disponible"
                 return job
             
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                self._bucket.acquire()
+                response = client.get(url)
                 if response.status_code == 200:
                     html = response.text
                     
-                    # Buscar la descripción en el HTML
-                    import re
+                    # LinkedIn incluye la oferta como JSON-LD (JobPosting): un solo parseo
+                    description = self._extract_jsonld_description(html)
                     
-                    # Patrones para extraer descripción
+                    # Patrones para extraer descripción del DOM si no hay JSON-LD
                     patterns = [
                         r'<div class="show-more-less-html__markup[^"]*"[^>]*>(.*?)</div>',
                         r'<div class="description__text[^"]*"[^>]*>(.*?)</div>',
                         r'"description":\s*"([^"]{100,})"',
                     ]
                     
-                    description = ""
-                    for pattern in patterns:
-                        match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
-                        if match:
-                            desc = match.group(1)
-                            # Limpiar HTML tags
-                            desc = re.sub(r'<[^>]+>', ' ', desc)
-                            desc = re.sub(r'\s+', ' ', desc).strip()
-                            # Decodificar entidades HTML
-                            import html as html_lib
-                            desc = html_lib.unescape(desc)
-                            if len(desc) > len(description):
-                                description = desc
+                    if len(description) <= 50:
+                        for pattern in patterns:
+                            match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
+                            if match:
+                                desc = match.group(1)
+                                # Limpiar HTML tags
+                                desc = re.sub(r'<[^>]+>', ' ', desc)
+                                desc = re.sub(r'\s+', ' ', desc).strip()
+                                # Decodificar entidades HTML
+                                desc = html_lib.unescape(desc)
+                                if len(desc) > len(description):
+                                    description = desc
                     
                     if description and len(description) > 50:
                         job['description'] = description[:5000]  # Limitar longitud
                     else:
-                        # Fallback: usar Selenium para esta oferta
-                        job['description'] = self._get_job_description(url) if self.driver else "Descripción no disponible"
+                        # Se reintenta con Selenium fuera del pool de hilos
+                        job['description'] = None
+                        failed_jobs.put(job)
                 else:
                     job['description'] = "Error al obtener descripción"
                     
@@ -423,7 +584,15 @@ class LinkedInScraper:
         completed = 0
         total = len(jobs)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Un único cliente HTTP/2 (thread-safe) multiplexa todas las peticiones
+        # sobre la misma conexión TLS en lugar de abrir una por oferta
+        limits = httpx.Limits(
+            max_keepalive_connections=self.max_workers,
+            max_connections=self.max_workers * 2
+        )
+        with httpx.Client(http2=True, headers=headers, timeout=10.0,
+                          limits=limits, follow_redirects=True) as client, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_job = {executor.submit(fetch_description, job): job for job in jobs}
             results = []
             
@@ -434,10 +603,45 @@ class LinkedInScraper:
                 if completed % 5 == 0 or completed == total:
                     logger.info(f"📊 Progreso: {completed}/{total} descripciones obtenidas")
         
+        # Fallback secuencial con Selenium para las que fallaron por HTTP
+        while not failed_jobs.empty():
+            job = failed_jobs.get()
+            job['description'] = self._get_job_description(job['url']) if self.driver else "Descripción no disponible"
+        
         # Mantener el orden original
         job_dict = {job['id']: job for job in results}
         return [job_dict.get(j['id'], j) for j in jobs]
     
+    def _extract_jsonld_description(self, html: str) -> str:
+        """
+        Extrae la descripción del bloque JSON-LD `JobPosting` de la página.
+        
+        Args:
+            html: HTML de la página de la oferta
+        
+        Returns:
+            Descripción en texto plano o cadena vacía si no hay JSON-LD válido
+        """
+        for match in JSONLD_SCRIPT_RE.finditer(html):
+            try:
+                data = json_loads(match.group(1))
+            except ValueError:
+                continue
+            
+            if isinstance(data, dict):
+                items = data.get('@graph', [data])
+            elif isinstance(data, list):
+                items = data
+            else:
+                continue
+            for item in items:
+                if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                    desc = html_lib.unescape(item.get('description') or '')
+                    desc = re.sub(r'<[^>]+>', ' ', desc)
+                    return re.sub(r'\s+', ' ', desc).strip()
+        
+        return ""
+    
     def _build_search_url(
         self,
         keywords: str,
@@ -508,6 +712,68 @@ class LinkedInScraper:
         
         return base_url + "&".join(params)
     
+    def _reset_learned_selectors(self) -> None:
+        """Olvida los selectores aprendidos y vuelve a la fase de aprendizaje."""
+        self._learned_selectors: Dict[str, str] = {}
+        self._selector_votes: Dict[str, List[str]] = {}
+        self._selector_misses: Dict[str, int] = {}
+    
+    def _card_text(self, card, selector: str) -> str:
+        """Devuelve el texto de un elemento de la tarjeta o cadena vacía."""
+        try:
+            return card.find_element(By.CSS_SELECTOR, selector).text.strip()
+        except (NoSuchElementException, StaleElementReferenceException):
+            return ""
+    
+    def _find_card_text(self, card, field: str, selectors: List[str]) -> str:
+        """
+        Busca el texto de un campo de la tarjeta probando sus selectores.
+        
+        En una misma búsqueda LinkedIn sirve siempre el mismo DOM, así que tras
+        las primeras tarjetas se fija el selector ganador de cada campo y solo
+        se recorre la lista completa si deja de funcionar.
+        
+        Args:
+            card: Elemento de la tarjeta
+            field: Nombre del campo (title, company, location)
+            selectors: Selectores candidatos en orden de preferencia
+        
+        Returns:
+            Texto encontrado o cadena vacía
+        """
+        learned = self._learned_selectors.get(field)
+        if learned:
+            text = self._card_text(card, learned)
+            if text:
+                # Solo cuentan los fallos seguidos: un fallo aislado no lo descarta
+                self._selector_misses[field] = 0
+                return text
+            
+            misses = self._selector_misses.get(field, 0) + 1
+            self._selector_misses[field] = misses
+            if misses > self.SELECTOR_MAX_MISSES:
+                # Solo se reaprende este campo; los demás conservan su selector
+                logger.debug(f"El selector aprendido de '{field}' ya no funciona, reaprendiendo")
+                del self._learned_selectors[field]
+                self._selector_votes.pop(field, None)
+                self._selector_misses.pop(field, None)
+        
+        for selector in selectors:
+            if selector == learned:
+                continue  # Ya se probó en esta tarjeta
+            text = self._card_text(card, selector)
+            if text:
+                if field not in self._learned_selectors:
+                    votes = self._selector_votes.setdefault(field, [])
+                    votes.append(selector)
+                    if len(votes) >= self.SELECTOR_LEARNING_CARDS:
+                        # Counter respeta el orden de aparición: en empate gana el primero visto
+                        self._learned_selectors[field] = Counter(votes).most_common(1)[0][0]
+                        del self._selector_votes[field]
+                return text
+        
+        return ""
+    
     def _extract_job_from_card(self, card) -> Optional[Dict[str, Any]]:
         """Extrae información de una tarjeta de trabajo."""
         try:
@@ -535,15 +801,7 @@ class LinkedInScraper:
             ]
             
             # Título
-            title = None
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
+            title = self._find_card_text(card, 'title', title_selectors)
             
             if not title:
                 # Intentar con el link
@@ -557,26 +815,10 @@ class LinkedInScraper:
                 return None
             
             # Empresa
-            company = "Empresa no especificada"
-            for selector in company_selectors:
-                try:
-                    company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    company = company_elem.text.strip()
-                    if company:
-                        break
-                except:
-                    continue
+            company = self._find_card_text(card, 'company', company_selectors) or "Empresa no especificada"
             
             # Ubicación
-            location = "Ubicación no especificada"
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
+            location = self._find_card_text(card, 'location', location_selectors) or "Ubicación no especificada"
             
             # URL
             try:
@@ -606,12 +848,19 @@ class LinkedInScraper:
         """Obtiene la descripción completa de una oferta visitando su página."""
         try:
             logger.debug(f"Obteniendo descripción de: {job_url}")
+            self._bucket.acquire()
             self.driver.get(job_url)
-            time.sleep(3)  # Esperar carga completa
+            
+            # Esperar a la descripción en vez de una pausa fija
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.DESCRIPTION_READY_SELECTOR))
+                )
+            except TimeoutException:
+                logger.debug(f"La descripción no apareció a tiempo: {job_url}")
             
             # Scroll para cargar contenido lazy
             self.driver.execute_script("window.scrollTo(0, 500);")
-            time.sleep(1)
             
             # Intentar hacer clic en "Ver más" si existe
             show_more_selectors = [
@@ -653,6 +902,8 @@ class LinkedInScraper:
                 "div[class*='description']"
             ]
             
+            # El primer selector con un texto largo (> 500 chars) es casi siempre
+            # la descripción completa: no hace falta consultar el resto
             description = ""
             for selector in description_selectors:
                 try:
@@ -663,35 +914,18 @@ class LinkedInScraper:
                             description = text
                 except:
                     continue
+                if len(description) > 500:
+                    break
             
-            # Si la descripción es corta, buscar en todo el body
-            if len(description) < 100:
-                try:
-                    # Buscar secciones que contengan palabras clave de ofertas
-                    sections = self.driver.find_elements(By.TAG_NAME, "section")
-                    for section in sections:
-                        text = section.text.strip()
-                        keywords = ["responsabilidades", "requisitos", "experiencia", 
-                                   "buscamos", "ofrecemos", "requirements", "responsibilities",
-                                   "qualifications", "skills", "about the role"]
-                        if any(kw in text.lower() for kw in keywords) and len(text) > len(description):
-                            description = text
-                except:
-                    pass
-            
-            # Último intento: buscar cualquier div grande con texto relevante
+            # Si la descripción es corta, buscar en el DOM con una sola llamada JS
+            # (leer .text de cada section/div son cientos de round-trips al driver)
             if len(description) < 100:
                 try:
-                    all_divs = self.driver.find_elements(By.CSS_SELECTOR, "div")
-                    for div in all_divs:
-                        text = div.text.strip()
-                        if len(text) > 200 and len(text) < 5000:
-                            keywords = ["salesforce", "developer", "experience", "requisitos", 
-                                       "responsabilidades", "skills", "apex", "lightning"]
-                            if any(kw in text.lower() for kw in keywords):
-                                if len(text) > len(description):
-                                    description = text
-                                    break
+                    text = self.driver.execute_script(
+                        self.LONGEST_DESCRIPTION_JS, self.DESCRIPTION_KEYWORDS
+                    ) or ""
+                    if len(text) > len(description):
+                        description = text
                 except:
                     pass
             
@@ -712,16 +946,26 @@ class LinkedInScraper:
         try:
             # Scroll al final para cargar más resultados
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
             
-            # Buscar botón de siguiente página
-            next_button = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "button[aria-label='Next'], .artdeco-pagination__button--next"
-            )
+            # Buscar botón de siguiente página (puede tardar en aparecer tras el scroll)
+            try:
+                next_button = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.NEXT_PAGE_SELECTOR))
+                )
+            except TimeoutException:
+                return False
             
             if next_button.is_enabled():
+                old_cards = self.driver.find_elements(By.CSS_SELECTOR, self.RESULT_CARD_SELECTOR)
+                self._bucket.acquire()
                 next_button.click()
+                
+                # Los nuevos resultados reemplazan a las tarjetas anteriores
+                if old_cards:
+                    try:
+                        WebDriverWait(self.driver, 10).until(EC.staleness_of(old_cards[0]))
+                    except TimeoutException:
+                        logger.debug("Las tarjetas anteriores siguen en la página tras pasar de página")
                 return True
             
             return False
@@ -747,70 +991,31 @@ class LinkedInScraper:
         
         try:
             logger.info(f"Obteniendo detalles de: {job_url}")
+            self._bucket.acquire()
             self.driver.get(job_url)
-            self._random_delay()
             
             details = {"url": job_url}
             
             # Esperar a que cargue el contenido
             WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-description, .description"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.DETAIL_READY_SELECTOR))
             )
             
-            # Título
-            try:
-                title_elem = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    ".job-details-jobs-unified-top-card__job-title, .top-card-layout__title"
-                )
-                details["title"] = title_elem.text.strip()
-            except:
-                pass
-            
-            # Empresa
-            try:
-                company_elem = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    ".job-details-jobs-unified-top-card__company-name, .topcard__org-name-link"
-                )
-                details["company"] = company_elem.text.strip()
-            except:
-                pass
-            
-            # Ubicación
-            try:
-                location_elem = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    ".job-details-jobs-unified-top-card__bullet, .topcard__flavor--bullet"
-                )
-                details["location"] = location_elem.text.strip()
-            except:
-                pass
+            # Todos los campos en una única llamada JS (un round-trip en vez de uno por campo)
+            data = self.driver.execute_script(
+                self.JOB_DETAILS_JS, self.DETAIL_SELECTORS, self.DETAIL_INSIGHT_SELECTOR
+            ) or {}
+            for field in self.DETAIL_SELECTORS:
+                if data.get(field) is not None:
+                    details[field] = data[field]
             
-            # Descripción completa
-            try:
-                desc_elem = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    ".jobs-description__content, .description__text"
-                )
-                details["description"] = desc_elem.text.strip()
-            except:
-                pass
-            
-            # Detalles adicionales (salario, tipo, etc.)
-            try:
-                insights = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    ".job-details-jobs-unified-top-card__job-insight"
-                )
-                for insight in insights:
-                    text = insight.text.strip()
-                    if "€" in text or "$" in text:
-                        details["salary"] = text
-                    elif any(word in text.lower() for word in ["full-time", "part-time", "contract"]):
-                        details["job_type"] = text
-            except:
-                pass
+            # Detalles adicionales (salario, tipo, etc.); un insight puede aportar ambos
+            for text in data.get("insights", []):
+                if SALARY_RE.search(text):
+                    details["salary"] = text
+                job_type = JOB_TYPE_RE.search(text)
+                if job_type:
+                    details["job_type"] = job_type.group(0)
             
             details["scraped_at"] = datetime.now().isoformat()
             
@@ -823,122 +1028,129 @@ class LinkedInScraper:
             logger.error(f"Error obteniendo detalles: {e}")
             return {"url": job_url, "error": str(e)}
     
+    def get_many_job_details(self, job_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Obtiene los detalles de varias ofertas en paralelo.
+        
+        Cada hilo toma un scraper de un pool (este mismo y hasta
+        `max_workers - 1` más), de modo que ningún driver se usa desde dos
+        hilos a la vez. Todos comparten el mismo rate limiter.
+        
+        Args:
+            job_urls: URLs de las ofertas
+        
+        Returns:
+            Detalles de cada oferta, en el mismo orden que `job_urls`
+        """
+        if not job_urls:
+            return []
+        
+        pool_size = max(1, min(self.max_workers, len(job_urls)))
+        pool: Queue = Queue()
+        pool.put(self)
+        extra_scrapers = []
+        for _ in range(pool_size - 1):
+            scraper = LinkedInScraper(headless=self.headless)
+            scraper._bucket = self._bucket
+            extra_scrapers.append(scraper)
+            pool.put(scraper)
+        
+        def fetch_details(url: str) -> Dict[str, Any]:
+            scraper = pool.get()
+            try:
+                return scraper.get_job_details(url)
+            finally:
+                pool.put(scraper)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                return list(executor.map(fetch_details, job_urls))
+        finally:
+            for scraper in extra_scrapers:
+                scraper.close()
+    
     def _save_job(self, job: Dict[str, Any]) -> None:
         """Guarda una oferta en disco."""
-        job_id = job.get('id', hashlib.md5(str(job).encode()).hexdigest()[:12])
-        filepath = self.jobs_dir / f"{job_id}.json"
+        self._save_jobs_bulk([job])
+    
+    def _save_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> None:
+        """
+        Guarda un lote de ofertas en disco en una sola pasada.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(job, f, ensure_ascii=False, indent=2)
+        Cada oferta se sigue guardando como `{id}.json` porque la web, el
+        generador de CVs y el menú interactivo las buscan por nombre de archivo.
+        El JSON se serializa directamente a bytes y se escribe con un único `write()`.
         
-        logger.debug(f"Oferta guardada: {filepath}")
+        Args:
+            jobs: Lista de ofertas a guardar
+        """
+        for job in jobs:
+            job_id = job.get('id') or self._fallback_job_id(job)
+            content = json_dumps(job)
+            with open(self.jobs_dir / f"{job_id}.json", 'wb', buffering=65536) as f:
+                f.write(content)
+        
+        # El snapshot ya no sirve: evitar que el próximo listado lo lea para descartarlo
+        if jobs:
+            invalidate_snapshot(self.jobs_dir)
+        
+        logger.debug(f"{len(jobs)} ofertas guardadas en {self.jobs_dir}")
+    
+    @staticmethod
+    def _fallback_job_id(job: Dict[str, Any]) -> str:
+        """Id estable para ofertas sin id, a partir de campos cortos (no de la descripción)."""
+        key = f"{job.get('url', '')}|{job.get('title', '')}|{job.get('company', '')}"
+        return hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
     
     def _get_sample_jobs(self, keywords: str, limit: int) -> List[Dict[str, Any]]:
         """Retorna ofertas de ejemplo para pruebas."""
         logger.info("Generando ofertas de ejemplo...")
         
-        sample_jobs = [
-            {
-                "id": "sample_001",
-                "title": "Senior Python Developer",
-                "company": "TechCorp España",
-                "location": "Madrid, Spain (Remote)",
-                "url": "https://www.linkedin.com/jobs/view/sample1",
-                "description": """
-                Buscamos un Senior Python Developer para unirse a nuestro equipo de desarrollo.
-                
-                Requisitos:
-                - 5+ años de experiencia con Python
-                - Experiencia con Django o FastAPI
-                - Conocimientos de PostgreSQL y Redis
-                - Experiencia con Docker y Kubernetes
-                - Inglés B2 o superior
-                
-                Ofrecemos:
-                - Trabajo 100% remoto
-                - Salario competitivo (50-70k€)
-                - Horario flexible
-                - Stock options
-                """,
-                "source": "sample",
-                "scraped_at": datetime.now().isoformat()
-            },
-            {
-                "id": "sample_002",
-                "title": "Backend Engineer",
-                "company": "Startup Innovadora",
-                "location": "Barcelona, Spain (Hybrid)",
-                "url": "https://www.linkedin.com/jobs/view/sample2",
-                "description": """
-                Startup fintech en crecimiento busca Backend Engineer.
-                
-                Tech Stack:
-                - Python, FastAPI
-                - PostgreSQL, MongoDB
-                - AWS (Lambda, ECS, S3)
-                - CI/CD con GitHub Actions
-                
-                Requisitos:
-                - 3+ años de experiencia
-                - Conocimientos de arquitectura de microservicios
-                - Experiencia con APIs REST
-                
-                Beneficios:
-                - Modelo híbrido (2 días oficina)
-                - Salario: 45-55k€
-                - Formación continua
-                """,
-                "source": "sample",
-                "scraped_at": datetime.now().isoformat()
-            },
-            {
-                "id": "sample_003",
-                "title": "Full Stack Developer",
-                "company": "Consultora Digital",
-                "location": "Remote, Spain",
-                "url": "https://www.linkedin.com/jobs/view/sample3",
-                "description": """
-                Buscamos Full Stack Developer para proyectos innovadores.
-                
-                Stack:
-                - Backend: Python/Node.js
-                - Frontend: React/Vue
-                - Base de datos: PostgreSQL
-                - Cloud: AWS
-                
-                Se valorará:
-                - Experiencia con TypeScript
-                - Conocimientos de DevOps
-                - Metodologías ágiles
-                
-                Oferta:
-                - 100% remoto
-                - 40-50k€ según experiencia
-                """,
-                "source": "sample",
-                "scraped_at": datetime.now().isoformat()
-            }
-        ]
+        kw = keywords.lower()
         
         # Filtrar por keywords si es posible
-        filtered = []
-        for job in sample_jobs:
-            if keywords.lower() in job['title'].lower() or keywords.lower() in job['description'].lower():
-                filtered.append(job)
+        filtered = [job for job, blob in SAMPLE_JOBS_INDEX if kw in blob]
         
         # Si no hay matches, devolver todos
-        result = filtered if filtered else sample_jobs
+        result = filtered if filtered else SAMPLE_JOBS
         
-        # Guardar samples
-        for job in result[:limit]:
-            self._save_job(job)
+        now = datetime.now().isoformat()
+        jobs = []
+        to_save = []
+        for sample in result[:limit]:
+            saved = self._read_saved_job(sample['id'])
+            # Solo se reescriben los samples cuyo contenido (sin contar la fecha) cambió;
+            # los demás se devuelven con la fecha que ya tienen en disco
+            if saved is not None and dict(saved, scraped_at=None) == dict(sample, scraped_at=None):
+                jobs.append(dict(sample, scraped_at=saved.get('scraped_at', now)))
+            else:
+                job = dict(sample, scraped_at=now)
+                jobs.append(job)
+                to_save.append(job)
         
-        return result[:limit]
+        self._save_jobs_bulk(to_save)
+        
+        return jobs
+    
+    def _read_saved_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Lee una oferta ya guardada (None si no existe o no es válida)."""
+        try:
+            with open(self.jobs_dir / f"{job_id}.json", 'rb') as f:
+                job = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return job if isinstance(job, dict) else None
     
     def close(self) -> None:
         """Cierra el navegador."""
         if self.driver:
-            self.driver.quit()
+            if self._pooled_driver:
+                # Devolver al pool (sin cookies) para que el próximo scraper no relance Chrome
+                driver_pool.release(self._pool_key, self.driver)
+                self._pooled_driver = False
+                self.is_logged_in = False
+            else:
+                self.driver.quit()
             self.driver = None
             logger.info("Driver cerrado")
     
@@ -949,3 +1161,119 @@ class LinkedInScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+# Ofertas de ejemplo (modo sin Selenium o sin resultados)
+SAMPLE_JOBS = [
+    {
+        "id": "sample_001",
+        "title": "Senior Python Developer",
+        "company": "TechCorp España",
+        "location": "Madrid, Spain (Remote)",
+        "url": "https://www.linkedin.com/jobs/view/sample1",
+        "description": """
+        Buscamos un Senior Python Developer para unirse a nuestro equipo de desarrollo.
+        
+        Requisitos:
+        - 5+ años de experiencia con Python
+        - Experiencia con Django o FastAPI
+        - Conocimientos de PostgreSQL y Redis
+        - Experiencia con Docker y Kubernetes
+        - Inglés B2 o superior
+        
+        Ofrecemos:
+        - Trabajo 100% remoto
+        - Salario competitivo (50-70k€)
+        - Horario flexible
+        - Stock options
+        """,
+        "source": "sample"
+    },
+    {
+        "id": "sample_002",
+        "title": "Backend Engineer",
+        "company": "Startup Innovadora",
+        "location": "Barcelona, Spain (Hybrid)",
+        "url": "https://www.linkedin.com/jobs/view/sample2",
+        "description": """
+        Startup fintech en crecimiento busca Backend Engineer.
+        
+        Tech Stack:
+        - Python, FastAPI
+        - PostgreSQL, MongoDB
+        - AWS (Lambda, ECS, S3)
+        - CI/CD con GitHub Actions
+        
+        Requisitos:
+        - 3+ años de experiencia
+        - Conocimientos de arquitectura de microservicios
+        - Experiencia con APIs REST
+        
+        Beneficios:
+        - Modelo híbrido (2 días oficina)
+        - Salario: 45-55k€
+        - Formación continua
+        """,
+        "source": "sample"
+    },
+    {
+        "id": "sample_003",
+        "title": "Full Stack Developer",
+        "company": "Consultora Digital",
+        "location": "Remote, Spain",
+        "url": "https://www.linkedin.com/jobs/view/sample3",
+        "description": """
+        Buscamos Full Stack Developer para proyectos innovadores.
+        
+        Stack:
+        - Backend: Python/Node.js
+        - Frontend: React/Vue
+        - Base de datos: PostgreSQL
+        - Cloud: AWS
+        
+        Se valorará:
+        - Experiencia con TypeScript
+        - Conocimientos de DevOps
+        - Metodologías ágiles
+        
+        Oferta:
+        - 100% remoto
+        - 40-50k€ según experiencia
+        """,
+        "source": "sample"
+    }
+]
+
+# Título + descripción en minúsculas, precalculado una sola vez
+SAMPLE_JOBS_INDEX = [
+    (job, f"{job['title']} {job['description']}".lower())
+    for job in SAMPLE_JOBS
+]
+
+
+def _search_worker(task: Tuple) -> List[Dict[str, Any]]:
+    """
+    Ejecuta una búsqueda en un proceso hijo (usado por `search_many`).
+    
+    Args:
+        task: Tupla (keywords, location, limit, headless, fetch_descriptions, fast_mode, rate, capacity)
+    
+    Returns:
+        Ofertas encontradas por esta búsqueda
+    """
+    keywords, location, limit, headless, fetch_descriptions, fast_mode, rate, capacity = task
+    try:
+        with LinkedInScraper(headless=headless) as scraper:
+            # Parte del límite de peticiones que le toca a este proceso
+            scraper._bucket = TokenBucket(rate=rate, capacity=capacity)
+            return scraper.search_jobs(
+                keywords,
+                location=location,
+                limit=limit,
+                fetch_descriptions=fetch_descriptions,
+                fast_mode=fast_mode
+            )
+    finally:
+        # Los workers terminan sin pasar por atexit: cerrar aquí los drivers
+        # que `close()` devolvió al pool para no dejar Chrome huérfano
+        driver_pool.close_all()
@@ -0,0 +1,42 @@
+"""
+Rate limiter - Token bucket para limitar las peticiones a LinkedIn.
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket thread-safe con un pequeño jitter en las esperas."""
+    
+    def __init__(self, rate: float, capacity: int = 10, jitter: float = 0.1):
+        """
+        Inicializa el bucket.
+        
+        Args:
+            rate: Tokens que se recuperan por segundo (peticiones/segundo)
+            capacity: Máximo de tokens acumulables (tamaño de ráfaga)
+            jitter: Fracción aleatoria añadida a cada espera para no ser periódico
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Consume un token; si no hay, espera exactamente lo que falta (más jitter)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            
+            self._tokens -= 1
+            deficit = -self._tokens
+        
+        # El token ya queda reservado: el resto de hilos calcula su espera a partir de él
+        if deficit > 0:
+            wait = deficit / self.rate
+            time.sleep(wait + random.uniform(0, wait * self.jitter))
@@ -3,5 +3,6 @@ Utils module - Utilidades varias.
 """
 
 from .config_loader import load_config, get_setting
+from .job_loader import load_all_jobs
 
-__all__ = ['load_config', 'get_setting']
+__all__ = ['load_config', 'get_setting', 'load_all_jobs']
@@ -2,30 +2,78 @@
 Cargador de configuración.
 """
 
+import copy
+import os
+import threading
 import yaml
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
+from .fast_io import SafeLoader
 
-def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
+DEFAULT_CONFIG_PATH = "config/settings.yaml"
+
+# Configuraciones ya parseadas (LRU): ruta -> ((mtime, tamaño), config)
+CACHE_SIZE = 32
+_CACHE: "OrderedDict[Path, Tuple[Tuple[float, int], Dict[str, Any]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+# Marca de "clave no encontrada" (None puede ser un valor legítimo)
+_MISSING = object()
+
+
+def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     """
     Carga la configuración desde un archivo YAML.
+    Solo se vuelve a parsear si el archivo ha cambiado (mtime o tamaño).
     
     Args:
         config_path: Ruta al archivo de configuración
         
     Returns:
-        Diccionario con la configuración
+        Diccionario con la configuración (una copia: modificarla no altera la caché)
     """
+    return copy.deepcopy(_load_cached(config_path))
+
+
+def _load_cached(config_path: str) -> Dict[str, Any]:
+    """Configuración parseada compartida por la caché (no debe modificarse)."""
     path = Path(config_path)
     
-    if not path.exists():
+    try:
+        version = _file_version(path)
+    except OSError:
         raise FileNotFoundError(f"Archivo de configuración no encontrado: {path}")
     
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path)
+        if cached and cached[0] == version:
+            _CACHE.move_to_end(path)
+            return cached[1]
+    
     with open(path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader) or {}
     
-    return config or {}
+    with _CACHE_LOCK:
+        _CACHE[path] = (version, config)
+        _CACHE.move_to_end(path)
+        if len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return config
+
+
+def _file_version(path: Path) -> Tuple[float, int]:
+    """(mtime, tamaño) del archivo: cambia cuando se reescribe."""
+    st = os.stat(path)
+    return st.st_mtime, st.st_size
+
+
+def invalidate_config(config_path: str = DEFAULT_CONFIG_PATH) -> None:
+    """Descarta la versión cacheada de un archivo de configuración."""
+    with _CACHE_LOCK:
+        _CACHE.pop(Path(config_path), None)
 
 
 def load_linkedin_config() -> Dict[str, Any]:
@@ -46,7 +94,23 @@ def get_setting(key: str, default: Any = None) -> Any:
         El valor de configuración
     """
     try:
-        config = load_config()
+        version = _file_version(Path(DEFAULT_CONFIG_PATH))
+    except OSError:
+        return default
+    
+    # La versión forma parte de la clave: si el archivo cambia, la caché se invalida sola
+    value = _lookup(key, version)
+    if value is _MISSING:
+        return default
+    # Las secciones (dict/list) son compartidas con la caché: se entrega una copia
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+@lru_cache(maxsize=256)
+def _lookup(key: str, version: Tuple[float, int]) -> Any:
+    """Resuelve una clave anidada en la configuración por defecto."""
+    try:
+        config = _load_cached(DEFAULT_CONFIG_PATH)
         
         # Navegar por claves anidadas
         keys = key.split('.')
@@ -57,4 +121,4 @@ def get_setting(key: str, default: Any = None) -> Any:
         return value
         
     except (KeyError, TypeError, FileNotFoundError):
-        return default
+        return _MISSING
@@ -0,0 +1,29 @@
+"""
+Serialización rápida - libyaml y orjson cuando están instalados, stdlib si no.
+"""
+
+import json
+from typing import Any
+
+# Loader/dumper en C (libyaml) si PyYAML se compiló con él
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# orjson trabaja directamente con bytes UTF-8
+try:
+    import orjson
+    HAS_ORJSON = True
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Serializa a JSON compacto en bytes UTF-8, terminado en salto de línea."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    HAS_ORJSON = False
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Serializa a JSON compacto en bytes UTF-8, terminado en salto de línea."""
+        return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
@@ -2,16 +2,21 @@
 Menú interactivo para AutoCV.
 """
 
-import inquirer
+import questionary
+from questionary import Choice
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from loguru import logger
-from pathlib import Path
-import json
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+from .job_loader import load_all_jobs
 
 console = Console()
 
+# Perfil de la última visita: (mtime del YAML, perfil, estadísticas)
+_profile_cache: Optional[Tuple[float, Dict[str, Any], Dict[str, Any]]] = None
+
 
 def run_interactive_menu():
     """Ejecuta el menú interactivo principal."""
@@ -19,30 +24,23 @@ def run_interactive_menu():
     while True:
         console.print("\n")
         
-        questions = [
-            inquirer.List(
-                'action',
-                message="¿Qué quieres hacer?",
-                choices=[
-                    ('📋 Ver mi perfil', 'profile'),
-                    ('🔍 Buscar ofertas de trabajo', 'search'),
-                    ('📄 Ver ofertas guardadas', 'list_jobs'),
-                    ('✨ Generar CV personalizado', 'generate'),
-                    ('📤 Aplicar a una oferta', 'apply'),
-                    ('⚙️  Configuración', 'settings'),
-                    ('❓ Ayuda', 'help'),
-                    ('🚪 Salir', 'exit'),
-                ],
-            )
-        ]
-        
-        answer = inquirer.prompt(questions)
+        action = questionary.select(
+            "¿Qué quieres hacer?",
+            choices=[
+                Choice('📋 Ver mi perfil', 'profile'),
+                Choice('🔍 Buscar ofertas de trabajo', 'search'),
+                Choice('📄 Ver ofertas guardadas', 'list_jobs'),
+                Choice('✨ Generar CV personalizado', 'generate'),
+                Choice('📤 Aplicar a una oferta', 'apply'),
+                Choice('⚙️  Configuración', 'settings'),
+                Choice('❓ Ayuda', 'help'),
+                Choice('🚪 Salir', 'exit'),
+            ],
+        ).ask()
         
-        if not answer:
+        if not action:
             break
         
-        action = answer['action']
-        
         if action == 'exit':
             console.print("\n👋 ¡Hasta luego! Buena suerte con tu búsqueda de empleo.\n", style="cyan")
             break
@@ -62,13 +60,40 @@ def run_interactive_menu():
             _show_help()
 
 
-def _show_profile():
-    """Muestra el perfil del usuario."""
+@lru_cache(maxsize=1)
+def _pm():
+    """ProfileManager compartido durante toda la sesión del menú."""
     from ..core.profile_manager import ProfileManager
+    return ProfileManager()
+
+
+def _cached_profile() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Perfil y estadísticas derivadas, recalculados solo si cambia el YAML.
     
-    try:
-        pm = ProfileManager()
+    Returns:
+        Tupla (perfil, estadísticas)
+    """
+    global _profile_cache
+    
+    pm = _pm()
+    mtime = pm.profile_path.stat().st_mtime
+    if _profile_cache is None or _profile_cache[0] != mtime:
         profile = pm.load_profile()
+        stats = {
+            'years': pm.get_total_experience_years(),
+            'skills': len(pm.get_all_skills()),
+            'issues': pm.validate_profile(profile),
+        }
+        _profile_cache = (mtime, profile, stats)
+    
+    return _profile_cache[1], _profile_cache[2]
+
+
+def _show_profile():
+    """Muestra el perfil del usuario."""
+    try:
+        profile, stats = _cached_profile()
         
         personal = profile.get('personal_information', {})
         
@@ -83,8 +108,8 @@ def _show_profile():
 [bold]Resumen:[/bold]
 • Educación: {len(profile.get('educacion', []))} entradas
 • Experiencia: {len(profile.get('experiencia', []))} empleos
-• Años totales: ~{pm.get_total_experience_years()} años
-• Habilidades técnicas: {len(pm.get_all_skills())} skills
+• Años totales: ~{stats['years']} años
+• Habilidades técnicas: {stats['skills']} skills
 • Idiomas: {len(profile.get('idiomas', []))} idiomas
 • Certificaciones: {len(profile.get('certificaciones', []))} certificaciones
             """,
@@ -93,7 +118,7 @@ def _show_profile():
         ))
         
         # Validar
-        issues = pm.validate_profile(profile)
+        issues = stats['issues']
         if issues:
             console.print("\n⚠️ [bold yellow]Problemas encontrados:[/bold yellow]")
             for issue in issues:
@@ -109,31 +134,32 @@ def _show_profile():
 
 def _search_jobs():
     """Busca ofertas de trabajo."""
-    questions = [
-        inquirer.Text('keywords', message="Palabras clave (ej: Python Developer)"),
-        inquirer.Text('location', message="Ubicación (opcional)", default=""),
-        inquirer.List(
-            'limit',
-            message="¿Cuántas ofertas buscar?",
-            choices=[('10', 10), ('20', 20), ('50', 50)],
-            default=20
-        )
-    ]
+    keywords = questionary.text("Palabras clave (ej: Python Developer)").ask()
+    if not keywords:
+        return
     
-    answers = inquirer.prompt(questions)
-    if not answers or not answers['keywords']:
+    location = questionary.text("Ubicación (opcional)", default="").ask()
+    if location is None:
         return
     
-    console.print(f"\n🔍 Buscando '{answers['keywords']}'...", style="cyan")
+    limit = questionary.select(
+        "¿Cuántas ofertas buscar?",
+        choices=[Choice('10', 10), Choice('20', 20), Choice('50', 50)],
+        default=20
+    ).ask()
+    if limit is None:
+        return
+    
+    console.print(f"\n🔍 Buscando '{keywords}'...", style="cyan")
     
     from ..scraper.linkedin_scraper import LinkedInScraper
     
     try:
         scraper = LinkedInScraper()
         jobs = scraper.search_jobs(
-            keywords=answers['keywords'],
-            location=answers['location'] or None,
-            limit=int(answers['limit'])
+            keywords=keywords,
+            location=location or None,
+            limit=int(limit)
         )
         
         if jobs:
@@ -148,85 +174,75 @@ def _search_jobs():
 
 def _list_saved_jobs():
     """Lista las ofertas guardadas."""
-    jobs_dir = Path("data/ofertas")
+    jobs = load_all_jobs("data/ofertas")
     
-    if not jobs_dir.exists():
+    if not jobs:
         console.print("\n📭 No hay ofertas guardadas", style="yellow")
         return
     
-    job_files = list(jobs_dir.glob("*.json"))
-    
-    if not job_files:
-        console.print("\n📭 No hay ofertas guardadas", style="yellow")
-        return
-    
-    jobs = []
-    for job_file in job_files:
-        try:
-            with open(job_file, 'r', encoding='utf-8') as f:
-                job = json.load(f)
-                jobs.append(job)
-        except:
-            continue
-    
     _display_jobs_table(jobs)
 
 
 def _display_jobs_table(jobs):
     """Muestra una tabla de ofertas."""
-    table = Table(title=f"Ofertas ({len(jobs)})")
+    from rich.table import Table
+    
+    # Filas ya truncadas, calculadas una sola vez
+    rows = [
+        (
+            str(job.get('id') or 'N/A')[:8],
+            (job.get('title') or 'N/A')[:28],
+            (job.get('company') or 'N/A')[:18],
+            (job.get('location') or 'N/A')[:18]
+        )
+        for job in jobs
+    ]
+    
+    table = Table(title=f"Ofertas ({len(rows)})", expand=False)
     table.add_column("ID", style="dim", width=10)
     table.add_column("Puesto", style="cyan", width=30)
     table.add_column("Empresa", style="green", width=20)
     table.add_column("Ubicación", style="yellow", width=20)
     
-    for job in jobs:
-        table.add_row(
-            str(job.get('id', 'N/A'))[:8],
-            job.get('title', 'N/A')[:28],
-            job.get('company', 'N/A')[:18],
-            job.get('location', 'N/A')[:18]
-        )
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
+    # Listas largas: paginar en vez de volcar todo de golpe
+    if len(rows) > 200:
+        with console.pager(styles=True):
+            console.print(table)
+    else:
+        console.print(table)
 
 
 def _generate_cv():
     """Genera un CV personalizado."""
-    jobs_dir = Path("data/ofertas")
-    job_files = list(jobs_dir.glob("*.json"))
+    # Solo las 100 más recientes: el selector no es usable con miles de opciones
+    jobs = load_all_jobs("data/ofertas", limit=100)
     
-    if not job_files:
+    if not jobs:
         console.print("\n⚠️ Primero busca ofertas de trabajo", style="yellow")
         return
     
-    # Listar ofertas disponibles
-    job_choices = []
-    for job_file in job_files:
-        try:
-            with open(job_file, 'r', encoding='utf-8') as f:
-                job = json.load(f)
-                label = f"{job.get('title', 'N/A')[:30]} @ {job.get('company', 'N/A')[:20]}"
-                job_choices.append((label, job.get('id', str(job_file.stem))))
-        except:
-            continue
-    
-    questions = [
-        inquirer.List(
-            'job_id',
-            message="Selecciona la oferta para personalizar el CV",
-            choices=job_choices
-        ),
-        inquirer.List(
-            'format',
-            message="Formato de salida",
-            choices=[('PDF', 'pdf'), ('HTML', 'html')],
-            default='pdf'
-        )
+    # Listar ofertas disponibles (etiquetas truncadas una sola vez)
+    job_choices = [
+        Choice(f"{job.get('title', 'N/A')[:30]} @ {job.get('company', 'N/A')[:20]}", job['id'])
+        for job in jobs
     ]
     
-    answers = inquirer.prompt(questions)
-    if not answers:
+    job_id = questionary.select(
+        "Selecciona la oferta para personalizar el CV",
+        choices=job_choices
+    ).ask()
+    if not job_id:
+        return
+    
+    output_format = questionary.select(
+        "Formato de salida",
+        choices=[Choice('PDF', 'pdf'), Choice('HTML', 'html')],
+        default='pdf'
+    ).ask()
+    if not output_format:
         return
     
     console.print(f"\n⏳ Generando CV personalizado...", style="cyan")
@@ -241,8 +257,8 @@ def _generate_cv():
         generator = CVGenerator()
         output_path = generator.generate(
             profile=profile,
-            job_id=answers['job_id'],
-            output_format=answers['format']
+            job_id=job_id,
+            output_format=output_format
         )
         
         console.print(f"\n✅ CV generado: [bold]{output_path}[/bold]", style="green")
@@ -0,0 +1,163 @@
+"""
+Cargador de ofertas guardadas.
+"""
+
+import heapq
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+from .fast_io import json_loads, json_dumps
+
+
+def _read_bytes(job_file: Path) -> Optional[bytes]:
+    try:
+        return job_file.read_bytes()
+    except OSError as e:
+        logger.debug(f"No se pudo leer {job_file.name}: {e}")
+        return None
+
+
+def _parse_job(job_file: Path, data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Parsea una oferta (con `id` = nombre del archivo si no tenía); None si no es válida."""
+    if data is None:
+        return None
+    try:
+        job = json_loads(data)
+    except ValueError as e:
+        logger.debug(f"JSON inválido en {job_file.name}: {e}")
+        return None
+    
+    if not isinstance(job, dict):
+        return None
+    job.setdefault('id', job_file.stem)
+    return job
+
+
+def snapshot_path(jobs_dir: str = "data/ofertas") -> Path:
+    """Ruta del snapshot JSONL de un directorio de ofertas (p. ej. data/ofertas.jsonl)."""
+    path = Path(jobs_dir)
+    return path.with_name(f"{path.name}.jsonl")
+
+
+def invalidate_snapshot(jobs_dir: str = "data/ofertas") -> None:
+    """
+    Descarta el snapshot JSONL.
+    
+    No es imprescindible (el snapshot se valida con el mtime y tamaño de cada
+    oferta), pero ahorra leerlo y compararlo cuando ya se sabe que está obsoleto.
+    """
+    try:
+        os.unlink(snapshot_path(jobs_dir))
+    except FileNotFoundError:
+        pass
+
+
+def _read_snapshot(jobs_dir: str, signature: Dict[str, List[int]]) -> Optional[List[Dict[str, Any]]]:
+    """Lee el snapshot si se generó con las mismas ofertas (nombre, mtime y tamaño)."""
+    try:
+        with open(snapshot_path(jobs_dir), 'rb', buffering=65536) as f:
+            header = json_loads(f.readline())
+            if header.get('files') != signature:
+                return None
+            return [json_loads(line) for line in f]
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_snapshot(jobs_dir: str, signature: Dict[str, List[int]], jobs: List[Dict[str, Any]]) -> None:
+    """Guarda todas las ofertas en un único JSONL (cabecera + una oferta por línea)."""
+    path = snapshot_path(jobs_dir)
+    # Temporal propio: varios listados simultáneos no escriben sobre el mismo archivo
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    except OSError as e:
+        logger.debug(f"No se pudo guardar el snapshot de ofertas: {e}")
+        return
+    try:
+        with open(fd, 'wb', buffering=65536) as f:
+            f.write(json_dumps({'files': signature}))
+            for job in jobs:
+                f.write(json_dumps(job))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.debug(f"No se pudo guardar el snapshot de ofertas: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def load_all_jobs(
+    jobs_dir: str = "data/ofertas",
+    max_workers: int = 16,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Carga las ofertas guardadas (más recientes primero).
+    
+    Si el snapshot JSONL está al día (mismos archivos con el mismo mtime y tamaño)
+    se lee solo ese archivo; si no, se leen los `{id}.json` por adelantado en varios
+    hilos mientras se van parseando y, en un listado completo, se regenera el snapshot.
+    
+    Args:
+        jobs_dir: Directorio de ofertas
+        max_workers: Hilos de lectura
+        limit: Máximo de ofertas a cargar (None = todas)
+    
+    Returns:
+        Lista de ofertas que se pudieron leer
+    """
+    try:
+        # scandir da el tipo de cada entrada sin stat extra
+        with os.scandir(jobs_dir) as it:
+            entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+    except FileNotFoundError:
+        return []
+    
+    if not entries:
+        return []
+    
+    # Firma tomada antes de leer: si una oferta se reescribe durante la lectura,
+    # su mtime ya no coincidirá y el snapshot se descartará en la siguiente carga
+    stats = {}
+    for entry in entries:
+        try:
+            stats[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+    entries = [e for e in entries if e.name in stats]
+    signature = {name: [st.st_mtime_ns, st.st_size] for name, st in stats.items()}
+    
+    # Un solo archivo secuencial en vez de un open/read/close por oferta
+    cached = _read_snapshot(jobs_dir, signature)
+    if cached is not None:
+        return cached if limit is None else cached[:limit]
+    
+    def mtime(entry: os.DirEntry) -> int:
+        return stats[entry.name].st_mtime_ns
+    
+    if limit is not None:
+        entries = heapq.nlargest(limit, entries, key=mtime)
+    else:
+        entries.sort(key=mtime, reverse=True)
+    
+    job_files = [Path(e.path) for e in entries]
+    
+    # Los hilos solo leen (read-ahead, liberan el GIL en la E/S) mientras este hilo
+    # parsea en orden lo que ya está en memoria: lectura y parseo se solapan
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(job_files))) as executor:
+        jobs = []
+        for job_file, data in zip(job_files, executor.map(_read_bytes, job_files)):
+            job = _parse_job(job_file, data)
+            if job is not None:
+                jobs.append(job)
+    
+    # Solo un listado completo sirve como snapshot
+    if limit is None:
+        _write_snapshot(jobs_dir, signature, jobs)
+    
+    return jobs
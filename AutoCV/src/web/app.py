@@ -3,26 +3,33 @@ AutoCV Web Interface - Aplicación web para gestionar CVs personalizados.
 """
 
 import asyncio
-import json
 import os
+import socket
 import sys
+import time
 import traceback
+import webbrowser
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
+import jinja2
+import aiofiles
+import httpx
 import uvicorn
 import yaml
 
 # Configurar loguru para reducir spam
 from loguru import logger
-import logging
 
 # Reducir nivel de log para módulos ruidosos
 logger.remove()  # Eliminar handler por defecto
@@ -32,15 +39,43 @@ logger.add(sys.stderr, level="INFO")  # Solo INFO y superior
 ROOT_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
-from src.core.profile_manager import ProfileManager
-from src.core.cv_generator import CVGenerator
-from src.scraper.linkedin_scraper import LinkedInScraper
-from src.ai.ollama_client import OllamaClient
+# Rutas de datos y configuración (calculadas una sola vez)
+JOBS_DIR = ROOT_DIR / "data" / "ofertas"
+CVS_DIR = ROOT_DIR / "data" / "cvs_generados"
+PROFILE_PATH = ROOT_DIR / "data" / "mi_perfil.yaml"
+CONFIG_PATH = ROOT_DIR / "config" / "settings.yaml"
+LINKEDIN_CONFIG_PATH = ROOT_DIR / "config" / "linkedin_config.yaml"
+
+from src.utils.fast_io import HAS_ORJSON, SafeLoader, SafeDumper, json_loads
+from src.utils.config_loader import load_config, invalidate_config
+from src.utils.job_loader import load_all_jobs
+
+# orjson también para serializar las respuestas si está instalado
+DefaultResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
+
+# ProfileManager, CVGenerator y LinkedInScraper se importan dentro de las
+# funciones que los usan: el scraper arrastra Selenium y no hace falta
+# pagarlo al arrancar el servidor ni para servir estáticos.
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Crea el pool de hilos y el cliente HTTP de Ollama de esta ejecución; al parar los libera."""
+    app.state.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="autocv")
+    # Cliente con keep-alive hacia Ollama, compartido por todas las peticiones
+    app.state.ollama_http = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=4))
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=False)
+        await app.state.ollama_http.aclose()
+
 
 app = FastAPI(
     title="AutoCV",
     description="Generador Automático de CVs Personalizados",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse,
+    lifespan=lifespan
 )
 
 # Configurar templates y archivos estáticos
@@ -50,21 +85,50 @@ STATIC_DIR = Path(__file__).parent / "static"
 TEMPLATES_DIR.mkdir(exist_ok=True)
 STATIC_DIR.mkdir(exist_ok=True)
 
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Plantillas compiladas cacheadas en disco; solo se revisa su mtime en desarrollo (AUTOCV_DEV)
+JINJA_CACHE_DIR = ROOT_DIR / ".jinja_cache"
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
+
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=True,
+    auto_reload=bool(os.getenv("AUTOCV_DEV")),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+    cache_size=400
+))
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
+
+# Líneas de log de la tarea actual que se conservan en memoria
+TASK_LOG_SIZE = 200
+
+
+@dataclass(slots=True, frozen=True)
+class TaskState:
+    """Estado de la tarea en background. Inmutable: se reemplaza entero en cada cambio."""
+    current: Optional[str] = None
+    progress: int = 0
+    message: str = ""
+    logs: Tuple[str, ...] = ()
+
+
 # Estado global de la aplicación
 app_state = {
-    "current_task": None,
-    "task_progress": 0,
-    "task_message": "",
-    "task_logs": [],
+    "task": TaskState(),
     # Caché de Ollama para evitar crear instancias constantemente
     "ollama_available": None,
     "ollama_model": None,
-    "ollama_last_check": 0
+    "ollama_last_check": 0,
+    "ollama_models": None,
+    "ollama_models_ts": 0
 }
 
+# Segundos que se reutiliza el último estado de Ollama
+OLLAMA_STATUS_TTL = 30
+
+# Recuentos de archivos por (directorio, extensión): (mtime_ns, recuento)
+_counts_cache: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
 
 # ============================================================================
 # Modelos Pydantic
@@ -150,44 +214,25 @@ async def settings_page(request: Request):
 @app.get("/api/status")
 async def get_status():
     """Estado del sistema."""
-    import time
+    ollama_available, ollama_model = await _get_ollama_status()
+    task = app_state["task"]
     
-    # Verificar Ollama solo cada 30 segundos (cacheado)
-    current_time = time.time()
-    if app_state["ollama_available"] is None or (current_time - app_state["ollama_last_check"]) > 30:
-        try:
-            # Crear cliente sin loggear cada vez
-            import logging
-            logging.getLogger("src.ai.ollama_client").setLevel(logging.WARNING)
-            
-            client = OllamaClient()
-            app_state["ollama_available"] = client.is_available()
-            app_state["ollama_model"] = client.model
-        except Exception as e:
-            app_state["ollama_available"] = False
-            app_state["ollama_model"] = f"Error: {str(e)}"
-        app_state["ollama_last_check"] = current_time
-    
-    # Contar ofertas y CVs
-    try:
-        jobs_count = len(list((ROOT_DIR / "data" / "ofertas").glob("*.json")))
-        cvs_count = len(list((ROOT_DIR / "data" / "cvs_generados").glob("*.html")))
-    except:
-        jobs_count = 0
-        cvs_count = 0
+    # Contar ofertas y CVs (solo se recuentan si cambia el directorio)
+    jobs_count = _count_files(JOBS_DIR, ".json")
+    cvs_count = _count_files(CVS_DIR, ".html")
     
     # Verificar perfil
-    profile_exists = (ROOT_DIR / "data" / "mi_perfil.yaml").exists()
+    profile_exists = PROFILE_PATH.exists()
     
     return {
-        "ollama_available": app_state["ollama_available"],
-        "ollama_model": app_state["ollama_model"],
+        "ollama_available": ollama_available,
+        "ollama_model": ollama_model,
         "jobs_count": jobs_count,
         "cvs_count": cvs_count,
         "profile_configured": profile_exists,
-        "current_task": app_state["current_task"],
-        "task_progress": app_state["task_progress"],
-        "task_message": app_state["task_message"]
+        "current_task": task.current,
+        "task_progress": task.progress,
+        "task_message": task.message
     }
 
 
@@ -195,15 +240,13 @@ async def get_status():
 async def get_profile():
     """Obtiene el perfil actual."""
     try:
-        profile_path = ROOT_DIR / "data" / "mi_perfil.yaml"
-        pm = ProfileManager(str(profile_path))
-        profile = pm.load_profile()
+        if not PROFILE_PATH.exists():
+            raise FileNotFoundError(f"Perfil no encontrado: {PROFILE_PATH}")
         
-        # También devolver el YAML raw
-        raw_yaml = ""
-        if profile_path.exists():
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                raw_yaml = f.read()
+        # Una sola lectura (asíncrona) para el YAML raw y el perfil parseado
+        async with aiofiles.open(PROFILE_PATH, 'r', encoding='utf-8') as f:
+            raw_yaml = await f.read()
+        profile = yaml.load(raw_yaml, Loader=SafeLoader)
         
         return {
             "profile": profile,
@@ -213,16 +256,32 @@ async def get_profile():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _validate_yaml(text: str) -> None:
+    """
+    Valida un YAML recorriendo solo los eventos del parser (sin construir el objeto).
+    
+    Además de los errores de sintaxis rechaza las etiquetas que SafeLoader no sabe
+    construir (p. ej. `!!python/object`), que harían fallar la siguiente lectura.
+    
+    Raises:
+        yaml.YAMLError: Si el documento no se podría cargar con SafeLoader
+    """
+    for event in yaml.parse(text, Loader=SafeLoader):
+        tag = getattr(event, 'tag', None)
+        if tag and tag != '!' and tag not in SafeLoader.yaml_constructors:
+            raise yaml.constructor.ConstructorError(
+                None, None, f"etiqueta no permitida {tag!r}", event.start_mark
+            )
+
+
 @app.post("/api/profile")
 async def update_profile(data: ProfileUpdate):
     """Actualiza el perfil."""
     try:
-        # Validar YAML
-        yaml.safe_load(data.content)
+        _validate_yaml(data.content)
         
-        profile_path = ROOT_DIR / "data" / "mi_perfil.yaml"
-        with open(profile_path, 'w', encoding='utf-8') as f:
-            f.write(data.content)
+        async with aiofiles.open(PROFILE_PATH, 'w', encoding='utf-8') as f:
+            await f.write(data.content)
         
         return {"success": True, "message": "Perfil actualizado correctamente"}
     except yaml.YAMLError as e:
@@ -234,31 +293,19 @@ async def update_profile(data: ProfileUpdate):
 @app.get("/api/jobs")
 async def get_jobs():
     """Lista todas las ofertas guardadas."""
-    jobs = []
-    jobs_dir = ROOT_DIR / "data" / "ofertas"
-    
-    for job_file in jobs_dir.glob("*.json"):
-        try:
-            with open(job_file, 'r', encoding='utf-8') as f:
-                job = json.load(f)
-                jobs.append(job)
-        except:
-            continue
-    
-    # Ordenar por fecha
-    jobs.sort(key=lambda x: x.get('scraped_at', ''), reverse=True)
+    # La lectura (bloqueante) va al pool de hilos para no frenar el event loop
+    loop = asyncio.get_running_loop()
+    jobs = await loop.run_in_executor(app.state.executor, _read_all_jobs)
     return {"jobs": jobs}
 
 
 @app.get("/api/jobs/{job_id}")
 async def get_job(job_id: str):
     """Obtiene una oferta específica."""
-    jobs_dir = ROOT_DIR / "data" / "ofertas"
-    
-    for job_file in jobs_dir.glob("*.json"):
-        if job_id in job_file.stem:
-            with open(job_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+    job_path = _find_job_file(JOBS_DIR, job_id)
+    if job_path:
+        with open(job_path, 'rb') as f:
+            return json_loads(f.read())
     
     raise HTTPException(status_code=404, detail="Oferta no encontrada")
 
@@ -266,12 +313,10 @@ async def get_job(job_id: str):
 @app.delete("/api/jobs/{job_id}")
 async def delete_job(job_id: str):
     """Elimina una oferta."""
-    jobs_dir = ROOT_DIR / "data" / "ofertas"
-    
-    for job_file in jobs_dir.glob("*.json"):
-        if job_id in job_file.stem:
-            job_file.unlink()
-            return {"success": True, "message": "Oferta eliminada"}
+    job_path = _find_job_file(JOBS_DIR, job_id)
+    if job_path:
+        os.unlink(job_path)
+        return {"success": True, "message": "Oferta eliminada"}
     
     raise HTTPException(status_code=404, detail="Oferta no encontrada")
 
@@ -279,13 +324,10 @@ async def delete_job(job_id: str):
 @app.post("/api/search")
 async def search_jobs(data: SearchRequest, background_tasks: BackgroundTasks):
     """Inicia una búsqueda de ofertas."""
-    if app_state["current_task"]:
+    if app_state["task"].current:
         raise HTTPException(status_code=400, detail="Ya hay una tarea en ejecución")
     
-    app_state["current_task"] = "search"
-    app_state["task_progress"] = 0
-    app_state["task_message"] = "Iniciando búsqueda..."
-    app_state["task_logs"] = []
+    app_state["task"] = TaskState(current="search", message="Iniciando búsqueda...")
     
     background_tasks.add_task(
         _run_search,
@@ -302,13 +344,10 @@ async def search_jobs(data: SearchRequest, background_tasks: BackgroundTasks):
 @app.post("/api/generate")
 async def generate_cv(data: GenerateRequest, background_tasks: BackgroundTasks):
     """Genera un CV para una oferta."""
-    if app_state["current_task"]:
+    if app_state["task"].current:
         raise HTTPException(status_code=400, detail="Ya hay una tarea en ejecución")
     
-    app_state["current_task"] = "generate"
-    app_state["task_progress"] = 0
-    app_state["task_message"] = "Iniciando generación..."
-    app_state["task_logs"] = []
+    app_state["task"] = TaskState(current="generate", message="Iniciando generación...")
     
     background_tasks.add_task(
         _run_generate,
@@ -323,47 +362,60 @@ async def generate_cv(data: GenerateRequest, background_tasks: BackgroundTasks):
 async def get_generated_cvs():
     """Lista todos los CVs generados."""
     cvs = []
-    cvs_dir = ROOT_DIR / "data" / "cvs_generados"
-    
-    for cv_file in cvs_dir.glob("cv_*.html"):
-        stat = cv_file.stat()
-        cvs.append({
-            "filename": cv_file.name,
-            "path": str(cv_file),
-            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "size": stat.st_size,
-            "type": "cv"
-        })
-    
-    for letter_file in cvs_dir.glob("carta_*.html"):
-        stat = letter_file.stat()
-        cvs.append({
-            "filename": letter_file.name,
-            "path": str(letter_file),
-            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "size": stat.st_size,
-            "type": "cover_letter"
-        })
-    
-    cvs.sort(key=lambda x: x['created_at'], reverse=True)
+    # Una sola pasada por el directorio para CVs y cartas
+    try:
+        with os.scandir(CVS_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".html"):
+                    continue
+                if name.startswith("cv_"):
+                    file_type = "cv"
+                elif name.startswith("carta_"):
+                    file_type = "cover_letter"
+                else:
+                    continue
+                
+                stat = entry.stat()
+                cvs.append({
+                    "filename": name,
+                    "path": entry.path,
+                    "created_at": stat.st_mtime,
+                    "size": stat.st_size,
+                    "type": file_type
+                })
+    except FileNotFoundError:
+        pass
+    
+    # Ordenar por el mtime numérico y formatear las fechas una sola vez al final
+    cvs.sort(key=itemgetter('created_at'), reverse=True)
+    for cv in cvs:
+        cv["created_at"] = datetime.fromtimestamp(cv["created_at"]).isoformat()
     return {"files": cvs}
 
 
 @app.get("/api/generated/{filename}")
-async def get_generated_file(filename: str):
-    """Obtiene un archivo generado."""
-    file_path = ROOT_DIR / "data" / "cvs_generados" / filename
+async def get_generated_file(filename: str, request: Request):
+    """Obtiene un archivo generado (con ETag para que el navegador revalide con 304)."""
+    file_path = CVS_DIR / filename
     
-    if not file_path.exists():
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Archivo no encontrado")
     
-    return FileResponse(file_path)
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "max-age=30"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(file_path, headers=headers, stat_result=stat)
 
 
 @app.delete("/api/generated/{filename}")
 async def delete_generated_file(filename: str):
     """Elimina un archivo generado."""
-    file_path = ROOT_DIR / "data" / "cvs_generados" / filename
+    file_path = CVS_DIR / filename
     
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Archivo no encontrado")
@@ -375,22 +427,12 @@ async def delete_generated_file(filename: str):
 @app.get("/api/settings")
 async def get_settings():
     """Obtiene la configuración."""
-    import sys
-    import requests
-    
     config = _load_config()
     linkedin_config = _load_linkedin_config()
     
     # Obtener modelos disponibles de Ollama
-    available_models = []
-    try:
-        ollama_host = config.get('ollama', {}).get('host', 'http://localhost:11434')
-        response = requests.get(f"{ollama_host}/api/tags", timeout=5)
-        if response.status_code == 200:
-            models_data = response.json()
-            available_models = [m['name'] for m in models_data.get('models', [])]
-    except:
-        available_models = ['qwen3:4b', 'llama3.2', 'mistral', 'gemma2']  # Defaults
+    ollama_host = config.get('ollama', {}).get('host', 'http://localhost:11434')
+    available_models = await _get_ollama_models(ollama_host)
     
     # Convertir config a formato plano para el frontend
     flat_settings = {
@@ -419,14 +461,13 @@ async def get_settings():
 async def update_settings(data: dict):
     """Actualiza la configuración."""
     try:
-        config_path = ROOT_DIR / "config" / "settings.yaml"
-        
         # Cargar config actual
         config = _load_config()
         
         # Actualizar con los nuevos valores
         if 'ollama' not in config:
             config['ollama'] = {}
+        previous_host = config['ollama'].get('host')
         config['ollama']['host'] = data.get('ollama_base_url', 'http://localhost:11434')
         config['ollama']['model'] = data.get('ollama_model', 'qwen3:4b')
         config['ollama']['temperature'] = float(data.get('temperature', 0.3))
@@ -441,12 +482,17 @@ async def update_settings(data: dict):
             config['cv_generation'] = {}
         config['cv_generation']['output_format'] = data.get('output_format', 'html')
         
-        # Guardar
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, allow_unicode=True, default_flow_style=False)
+        # Serializar antes de abrir (truncar) el archivo: una única escritura y
+        # el menor tiempo posible con el archivo a medio escribir
+        text = yaml.dump(config, Dumper=SafeDumper, allow_unicode=True, default_flow_style=False)
+        async with aiofiles.open(CONFIG_PATH, 'w', encoding='utf-8') as f:
+            await f.write(text)
         
-        # Invalidar caché de Ollama para que tome los nuevos valores
+        # Invalidar cachés para que se tomen los nuevos valores
+        invalidate_config(str(CONFIG_PATH))
         app_state["ollama_last_check"] = 0
+        if config['ollama']['host'] != previous_host:
+            app_state["ollama_models"] = None
         
         return {"success": True, "message": "Configuración guardada"}
     except Exception as e:
@@ -456,11 +502,13 @@ async def update_settings(data: dict):
 @app.get("/api/task/status")
 async def get_task_status():
     """Estado de la tarea actual."""
+    # Una sola lectura: snapshot coherente aunque la tarea siga escribiendo
+    task = app_state["task"]
     return {
-        "current_task": app_state["current_task"],
-        "progress": app_state["task_progress"],
-        "message": app_state["task_message"],
-        "logs": app_state["task_logs"][-20:]  # Últimos 20 logs
+        "current_task": task.current,
+        "progress": task.progress,
+        "message": task.message,
+        "logs": task.logs[-20:]  # Últimos 20 logs
     }
 
 
@@ -469,36 +517,164 @@ async def get_task_status():
 # ============================================================================
 
 def _load_config() -> Dict[str, Any]:
-    """Carga la configuración general."""
-    config_path = ROOT_DIR / "config" / "settings.yaml"
-    if config_path.exists():
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Carga la configuración general ({} si no existe)."""
+    try:
+        return load_config(str(CONFIG_PATH))
+    except FileNotFoundError:
+        return {}
 
 
 def _load_linkedin_config() -> Dict[str, Any]:
-    """Carga la configuración de LinkedIn."""
-    config_path = ROOT_DIR / "config" / "linkedin_config.yaml"
-    if config_path.exists():
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Carga la configuración de LinkedIn ({} si no existe)."""
+    try:
+        return load_config(str(LINKEDIN_CONFIG_PATH))
+    except FileNotFoundError:
+        return {}
+
+
+async def _get_ollama_models(host: str) -> List[str]:
+    """
+    Modelos instalados en Ollama, consultados como mucho cada OLLAMA_STATUS_TTL segundos.
+    
+    Args:
+        host: URL base de Ollama
+    
+    Returns:
+        Nombres de los modelos (o una lista por defecto si Ollama no responde)
+    """
+    if app_state["ollama_models"] is not None and (time.time() - app_state["ollama_models_ts"]) < OLLAMA_STATUS_TTL:
+        return app_state["ollama_models"]
+    
+    available_models = None
+    try:
+        response = await app.state.ollama_http.get(f"{host}/api/tags")
+        if response.status_code == 200:
+            models_data = response.json()
+            available_models = [m['name'] for m in models_data.get('models', [])]
+    except Exception:
+        pass
+    
+    if available_models is None:
+        available_models = ['qwen3:4b', 'llama3.2', 'mistral', 'gemma2']  # Defaults
+    
+    app_state["ollama_models"] = available_models
+    app_state["ollama_models_ts"] = time.time()
+    return available_models
+
+
+async def _get_ollama_status() -> Tuple[bool, str]:
+    """
+    Disponibilidad y modelo de Ollama, comprobados como mucho cada OLLAMA_STATUS_TTL segundos.
+    
+    Returns:
+        Tupla (disponible, modelo)
+    """
+    if app_state["ollama_available"] is None or (time.time() - app_state["ollama_last_check"]) > OLLAMA_STATUS_TTL:
+        model = 'qwen3:4b'
+        try:
+            ollama_config = _load_config().get('ollama', {})
+            model = ollama_config.get('model', model)
+            host = ollama_config.get('host', 'http://localhost:11434')
+            # /api/version es la respuesta más ligera de Ollama (no lista modelos)
+            response = await app.state.ollama_http.get(f"{host}/api/version", timeout=1.0)
+            available = response.status_code == 200
+        except Exception:
+            # Host mal formado, config ilegible, sin conexión...: no disponible
+            available = False
+        
+        app_state["ollama_available"] = available
+        app_state["ollama_model"] = model
+        app_state["ollama_last_check"] = time.time()
+    
+    return app_state["ollama_available"], app_state["ollama_model"]
+
+
+def _read_all_jobs() -> List[Dict[str, Any]]:
+    """Lee todas las ofertas guardadas, ordenadas por fecha (más recientes primero)."""
+    jobs = load_all_jobs(str(JOBS_DIR))
+    jobs.sort(key=lambda x: x.get('scraped_at') or '', reverse=True)
+    return jobs
+
+
+def _find_job_file(jobs_dir: Path, job_id: str) -> Optional[str]:
+    """
+    Ruta del JSON de una oferta.
+    
+    Lo normal es que el id sea el nombre completo del archivo (acceso directo);
+    si no, se busca como parte del nombre recorriendo el directorio.
+    """
+    if os.sep not in job_id:
+        candidate = jobs_dir / f"{job_id}.json"
+        if candidate.is_file():
+            return str(candidate)
+    
+    for entry in _iter_json(jobs_dir):
+        if job_id in entry.name[:-5]:
+            return entry.path
+    return None
+
+
+def _iter_json(directory: Path) -> Iterator[os.DirEntry]:
+    """Recorre los .json de un directorio con scandir (sin crear un Path por entrada)."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def _count_files(directory: Path, suffix: str) -> int:
+    """
+    Cuenta los archivos con una extensión, reutilizando el recuento mientras
+    el mtime del directorio no cambie (crear o borrar archivos lo cambia).
+    
+    Args:
+        directory: Directorio a contar
+        suffix: Extensión (p. ej. ".json")
+    
+    Returns:
+        Número de archivos (0 si el directorio no existe)
+    """
+    key = (str(directory), suffix)
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        
+        cached = _counts_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # El directorio puede desaparecer entre el stat y el recorrido
+        with os.scandir(directory) as it:
+            count = sum(1 for e in it if e.name.endswith(suffix))
+    except OSError:
+        return 0
+    
+    _counts_cache[key] = (mtime_ns, count)
+    return count
 
 
 def _log(message: str):
     """Añade un mensaje al log."""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    app_state["task_logs"].append(f"[{timestamp}] {message}")
-    app_state["task_message"] = message
+    logs = app_state["task"].logs + (f"[{timestamp}] {message}",)
+    _update_task(logs=logs[-TASK_LOG_SIZE:], message=message)
+
+
+def _update_task(**changes):
+    """Sustituye el estado de la tarea por una copia con `changes` (copy-on-write)."""
+    app_state["task"] = replace(app_state["task"], **changes)
 
 
 def _sync_search(keywords: str, location: str, limit: int, fast_mode: bool = True, fetch_descriptions: bool = True):
     """Ejecuta la búsqueda de forma síncrona (para ejecutar en thread)."""
+    from src.scraper.linkedin_scraper import LinkedInScraper
+    
     try:
         mode_msg = "🚀 Modo rápido" if fast_mode else "🐢 Modo normal"
         _log(f"{mode_msg} - Buscando: {keywords} en {location}")
-        app_state["task_progress"] = 10
+        _update_task(progress=10)
         
         config = _load_config()
         # La configuración de headless está en linkedin, no en scraper
@@ -510,12 +686,12 @@ def _sync_search(keywords: str, location: str, limit: int, fast_mode: bool = Tru
             _log("Conectando a Chrome existente (puerto 9222)...")
         else:
             _log("Inicializando navegador...")
-        app_state["task_progress"] = 20
+        _update_task(progress=20)
         
         scraper = LinkedInScraper(headless=headless, use_existing_browser=use_existing_browser)
         
         _log("Buscando ofertas en LinkedIn...")
-        app_state["task_progress"] = 30
+        _update_task(progress=30)
         
         jobs = scraper.search_jobs(
             keywords=keywords,
@@ -525,12 +701,12 @@ def _sync_search(keywords: str, location: str, limit: int, fast_mode: bool = Tru
             fetch_descriptions=fetch_descriptions
         )
         
-        app_state["task_progress"] = 90
+        _update_task(progress=90)
         _log(f"Se encontraron {len(jobs)} ofertas")
         
         scraper.close()
         
-        app_state["task_progress"] = 100
+        _update_task(progress=100)
         _log("Búsqueda completada")
         
         return jobs
@@ -540,41 +716,42 @@ def _sync_search(keywords: str, location: str, limit: int, fast_mode: bool = Tru
         _log(f"Detalle: {traceback.format_exc()}")
         raise
     finally:
-        app_state["current_task"] = None
+        _update_task(current=None)
 
 
 async def _run_search(keywords: str, location: str, limit: int, fast_mode: bool = True, fetch_descriptions: bool = True):
     """Ejecuta la búsqueda en background usando un thread."""
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        await loop.run_in_executor(
-            executor,
-            _sync_search,
-            keywords,
-            location,
-            limit,
-            fast_mode,
-            fetch_descriptions
-        )
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        app.state.executor,
+        _sync_search,
+        keywords,
+        location,
+        limit,
+        fast_mode,
+        fetch_descriptions
+    )
 
 
 def _sync_generate(job_id: str, include_cover_letter: bool):
     """Ejecuta la generación de forma síncrona (para ejecutar en thread)."""
+    from src.core.profile_manager import ProfileManager
+    from src.core.cv_generator import CVGenerator
+    
     try:
         _log(f"Generando CV para oferta: {job_id}")
-        app_state["task_progress"] = 10
+        _update_task(progress=10)
         
-        profile_path = ROOT_DIR / "data" / "mi_perfil.yaml"
-        pm = ProfileManager(str(profile_path))
+        pm = ProfileManager(str(PROFILE_PATH))
         profile = pm.load_profile()
         
         _log("Perfil cargado")
-        app_state["task_progress"] = 20
+        _update_task(progress=20)
         
         generator = CVGenerator()
         
         _log("Personalizando CV con IA...")
-        app_state["task_progress"] = 30
+        _update_task(progress=30)
         
         result = generator.generate(
             profile=profile,
@@ -583,13 +760,13 @@ def _sync_generate(job_id: str, include_cover_letter: bool):
             include_cover_letter=include_cover_letter
         )
         
-        app_state["task_progress"] = 90
+        _update_task(progress=90)
         _log(f"CV generado: {result.get('cv', 'N/A')}")
         
         if result.get('cover_letter'):
             _log(f"Carta generada: {result.get('cover_letter')}")
         
-        app_state["task_progress"] = 100
+        _update_task(progress=100)
         _log("Generación completada")
         
         return result
@@ -599,19 +776,18 @@ def _sync_generate(job_id: str, include_cover_letter: bool):
         _log(f"Detalle: {traceback.format_exc()}")
         raise
     finally:
-        app_state["current_task"] = None
+        _update_task(current=None)
 
 
 async def _run_generate(job_id: str, include_cover_letter: bool):
     """Ejecuta la generación en background usando un thread."""
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        await loop.run_in_executor(
-            executor,
-            _sync_generate,
-            job_id,
-            include_cover_letter
-        )
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        app.state.executor,
+        _sync_generate,
+        job_id,
+        include_cover_letter
+    )
 
 
 # ============================================================================
@@ -620,8 +796,6 @@ async def _run_generate(job_id: str, include_cover_letter: bool):
 
 def run_server(host: str = None, port: int = None):
     """Inicia el servidor web."""
-    import webbrowser
-    import socket
     
     # Cargar configuración
     config = _load_config()
@@ -643,11 +817,12 @@ def run_server(host: str = None, port: int = None):
     local_ip = "127.0.0.1"
     if host == "0.0.0.0":
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-        except:
+            # UDP: connect() solo elige la interfaz de salida, no envía nada
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.settimeout(0.5)
+                s.connect(("8.8.8.8", 80))
+                local_ip = s.getsockname()[0]
+        except OSError:
             pass
     
     print(f"\n🚀 AutoCV Web Interface")